@@ -0,0 +1,67 @@
+import asyncio
+from typing import Callable
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+class FakeEmitter:
+    """Records event listeners like Playwright objects do and fires them with `emit`."""
+
+    def __init__(self) -> None:
+        self.listeners: list[tuple[str, Callable]] = []
+
+    def on(self, event: str, handler: Callable) -> None:
+        self.listeners.append((event, handler))
+
+    def once(self, event: str, handler: Callable) -> None:
+        self.listeners.append((event, handler))
+
+    def remove_listener(self, event: str, handler: Callable) -> None:
+        self.listeners.remove((event, handler))
+
+    def emit(self, event: str, *args) -> None:
+        for name, handler in list(self.listeners):
+            if name == event:
+                handler(*args)
+
+
+class FakePage(FakeEmitter):
+    def __init__(self, context: "FakeContext | None" = None) -> None:
+        super().__init__()
+        self.context = context
+        self.url = "https://example.com"
+        self.closed = False
+
+    def is_closed(self) -> bool:
+        return self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+    async def goto(self, url: str) -> None:
+        self.url = url
+
+
+class FakeContext(FakeEmitter):
+    def __init__(self) -> None:
+        super().__init__()
+        self.pages: list[FakePage] = []
+        self.init_scripts: list[str] = []
+        self.closed = False
+        self.cookies_cleared = False
+
+    async def new_page(self) -> FakePage:
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def clear_cookies(self) -> None:
+        self.cookies_cleared = True
+
+    async def close(self) -> None:
+        self.closed = True
+
+    def add_init_script(self, script: str) -> None:
+        self.init_scripts.append(script)
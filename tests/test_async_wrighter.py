@@ -0,0 +1,108 @@
+import pytest
+
+import wrighter.async_wrighter
+from conftest import FakeContext, run
+from wrighter.async_wrighter import AsyncWrighter
+
+
+class FakeBrowser:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+
+    async def new_context(self, **kwargs) -> FakeContext:
+        context = FakeContext()
+        self.log.append("new context")
+        return context
+
+    async def close(self) -> None:
+        self.log.append("close browser")
+
+
+class FakePlaywright:
+    def __init__(self, driver: "FakeAsyncPlaywright") -> None:
+        self.driver = driver
+        self.log = driver.log
+        self.devices = {"Desktop Chrome": {"user_agent": "Fake/1.0"}}
+        self.chromium = self.firefox = self.webkit = self
+
+    async def launch(self, **kwargs) -> FakeBrowser:
+        if self.driver.fail_launch:
+            raise RuntimeError("browser executable missing")
+        return FakeBrowser(self.log)
+
+    async def stop(self) -> None:
+        self.log.append("stop playwright")
+
+
+class FakeAsyncPlaywright:
+    def __init__(self) -> None:
+        self.log: list[str] = []
+        self.fail_launch = False
+
+    def __call__(self):
+        return self
+
+    async def start(self) -> FakePlaywright:
+        self.log.append("start playwright")
+        return FakePlaywright(self)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeAsyncPlaywright()
+    monkeypatch.setattr(wrighter.async_wrighter, "async_playwright", fake)
+    return fake
+
+
+@pytest.fixture
+def options(tmp_path):
+    return {"data_dir": str(tmp_path), "context_pool_min_size": 2}
+
+
+def test_start_and_stop(fake, options):
+    async def main():
+        w = AsyncWrighter(options)
+        await w.start()
+        assert fake.log.count("new context") == 3
+        await w.stop()
+        await w.stop()
+        assert fake.log[-2:] == ["close browser", "stop playwright"]
+        assert w.page_pool is None and w.context_pool is None
+
+    run(main())
+
+
+def test_failed_start_stops_playwright_and_can_be_retried(fake, options):
+    async def main():
+        w = AsyncWrighter(options)
+        fake.fail_launch = True
+        with pytest.raises(RuntimeError, match="browser executable missing"):
+            await w.start()
+        assert fake.log == ["start playwright", "stop playwright"]
+        assert w.contexts == []
+        fake.fail_launch = False
+        await w.start()
+        assert fake.log.count("start playwright") == 2
+        await w.stop()
+
+    run(main())
+
+
+def test_failed_pool_fill_closes_the_browser(fake, options):
+    async def main():
+        w = AsyncWrighter(options)
+        created = 0
+
+        async def new_context():
+            nonlocal created
+            created += 1
+            if created > 1:
+                raise RuntimeError("context limit")
+            return FakeContext()
+
+        w.new_context = new_context
+        with pytest.raises(RuntimeError, match="context limit"):
+            await w.start()
+        assert fake.log[-2:] == ["close browser", "stop playwright"]
+
+    run(main())
@@ -0,0 +1,54 @@
+import copy
+
+from wrighter.options import WrighterOptions, load_wrighter_opts
+
+
+def test_assignment_invalidates_collected_options():
+    options = WrighterOptions()
+    assert "locale" not in options.context_options
+    options.locale = "en-US"
+    assert options.context_options["locale"] == "en-US"
+    options.locale = None
+    assert "locale" not in options.context_options
+
+
+def test_collected_options_are_copies():
+    options = WrighterOptions(locale="en-US")
+    options.context_options["locale"] = "de-DE"
+    assert options.context_options["locale"] == "en-US"
+
+
+def test_model_copy_does_not_share_the_cache():
+    options = WrighterOptions(locale="en-US")
+    assert options.context_options["locale"] == "en-US"
+    copied = options.model_copy(update={"locale": "de-DE"})
+    assert copied.context_options["locale"] == "de-DE"
+    assert options.context_options["locale"] == "en-US"
+
+
+def test_deepcopy_does_not_share_the_cache():
+    options = WrighterOptions(locale="en-US")
+    assert options.context_options["locale"] == "en-US"
+    copied = copy.deepcopy(options)
+    copied.locale = "de-DE"
+    assert copied.context_options["locale"] == "de-DE"
+    assert options.context_options["locale"] == "en-US"
+
+
+def test_trusted_load_from_exported_file(tmp_path):
+    path = tmp_path / "options.json"
+    options = WrighterOptions(browser="firefox", user_agent="Ägent/1.0 ☃", args=["--mute-audio"])
+    options.export(path)
+    loaded = load_wrighter_opts(path, trusted=True)
+    assert loaded.browser == "firefox"
+    assert loaded.user_agent == "Ägent/1.0 ☃"
+    assert loaded.args == ["--mute-audio"]
+    assert loaded.browser_launch_options == options.browser_launch_options
+
+
+def test_trusted_load_from_mapping_skips_validation():
+    loaded = load_wrighter_opts({"browser": "firefox", "locale": "en-US"}, trusted=True)
+    assert loaded.browser == "firefox"
+    assert loaded.context_options["locale"] == "en-US"
+    assert load_wrighter_opts({"browser": "Chrome"}, trusted=True).browser == "Chrome"
+    assert load_wrighter_opts({"browser": "Chrome"}).browser == "chromium"
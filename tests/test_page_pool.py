@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from conftest import FakeContext, run
+from wrighter.page_pool import PagePool
+
+
+def test_page_is_reused():
+    async def main():
+        context = FakeContext()
+        pool = PagePool(context)  # type:ignore
+        async with pool.acquire() as first:
+            pass
+        async with pool.acquire() as second:
+            pass
+        assert first is second
+        assert len(context.pages) == 1
+        assert pool.idle == 1
+
+    run(main())
+
+
+def test_pages_are_closed_without_reuse():
+    async def main():
+        context = FakeContext()
+        pool = PagePool(context, reuse_pages=False)  # type:ignore
+        async with pool.acquire() as page:
+            pass
+        assert page.closed
+        assert pool.idle == 0
+
+    run(main())
+
+
+def test_closed_idle_pages_are_skipped():
+    async def main():
+        context = FakeContext()
+        pool = PagePool(context)  # type:ignore
+        async with pool.acquire() as page:
+            pass
+        page.closed = True
+        async with pool.acquire() as new_page:
+            pass
+        assert new_page is not page
+
+    run(main())
+
+
+def test_reset_between_uses_keeps_context_state():
+    async def main():
+        context = FakeContext()
+        pool = PagePool(context, reset_between_uses=True)  # type:ignore
+        async with pool.acquire() as page:
+            pass
+        assert page.url == "about:blank"
+        assert not context.cookies_cleared
+
+    run(main())
+
+
+def test_max_pages_bounds_concurrent_use():
+    async def main():
+        context = FakeContext()
+        pool = PagePool(context, max_pages=2)  # type:ignore
+        entered = 0
+        release = asyncio.Event()
+
+        async def task():
+            nonlocal entered
+            async with pool.acquire():
+                entered += 1
+                await release.wait()
+
+        tasks = [asyncio.ensure_future(task()) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        assert entered == 2
+        release.set()
+        await asyncio.wait_for(asyncio.gather(*tasks), timeout=1)
+        assert entered == 3
+        assert len(context.pages) == 2
+
+    run(main())
+
+
+def test_close_closes_idle_pages():
+    async def main():
+        context = FakeContext()
+        pool = PagePool(context)  # type:ignore
+        async with pool.acquire() as page:
+            pass
+        await pool.close()
+        assert page.closed
+        assert pool.idle == 0
+
+    run(main())
+
+
+def test_invalid_max_pages():
+    with pytest.raises(ValueError):
+        PagePool(FakeContext(), max_pages=0)  # type:ignore
@@ -0,0 +1,83 @@
+import pytest
+
+from wrighter.plugin import Plugin, context, page
+from wrighter.plugin_manager import PluginManager
+
+
+class Base(Plugin):
+    @page("on", "request")
+    def on_request(self, request):
+        pass
+
+
+def test_events_are_split_by_target_and_kind():
+    class P(Plugin):
+        @page("on", "request")
+        def on_request(self, request):
+            pass
+
+        @page("once", "load")
+        def on_load(self, page):
+            pass
+
+        @context("on", "page")
+        def on_page(self, page):
+            pass
+
+    assert P.__page_events__ == ((("request", "on_request"),), (("load", "on_load"),))
+    assert P.__context_events__ == ((("page", "on_page"),), ())
+
+
+def test_undecorated_override_is_not_a_handler():
+    class Override(Base):
+        def on_request(self, request):
+            pass
+
+    class Other(Base):
+        pass
+
+    class Diamond(Override, Other):
+        pass
+
+    assert Override.__plugin_events__ == ()
+    assert Diamond.__plugin_events__ == ()
+
+
+def test_inherited_and_mixin_handlers_are_found():
+    class Mixin:
+        @context("on", "page")
+        def on_page(self, page):
+            pass
+
+    class P(Mixin, Base):
+        pass
+
+    assert {name for _, name in P.__plugin_events__} == {"on_request", "on_page"}
+
+
+def test_handlers_are_bound_to_the_instance():
+    plugin = Base()
+    ((name, handler),) = plugin._page_on
+    assert name == "request"
+    assert handler == plugin.on_request
+
+
+def test_handlers_are_bound_without_plugin_init():
+    class NoSuperInit(Base):
+        def __init__(self) -> None:
+            self.value = 1
+
+    plugin = NoSuperInit()
+    PluginManager(None, [plugin])
+    assert plugin.has_page_events
+    assert not plugin.has_context_events
+    assert [name for name, _ in plugin._page_on] == ["request"]
+
+
+def test_missing_attributes_keep_their_error():
+    class NoSuperInit(Base):
+        def __init__(self) -> None:
+            pass
+
+    with pytest.raises(AttributeError, match="_description"):
+        NoSuperInit().description
@@ -0,0 +1,112 @@
+import abc
+
+from conftest import FakeContext, FakePage
+from wrighter.plugin import Plugin, context, page
+from wrighter.plugin_manager import PluginManager
+
+
+class PagePlugin(Plugin):
+    @page("on", "request")
+    def on_request(self, request):
+        pass
+
+
+class ContextPlugin(Plugin):
+    @context("on", "page")
+    def on_page(self, page):
+        pass
+
+
+class ChildPlugin(PagePlugin):
+    pass
+
+
+class Marker(abc.ABC):
+    pass
+
+
+Marker.register(ContextPlugin)
+
+
+class FakeWrighter:
+    def __init__(self) -> None:
+        self.pages = [FakePage()]
+        self.contexts = [FakeContext()]
+
+
+def test_has_plugins():
+    manager = PluginManager(FakeWrighter())
+    assert not manager.has_plugins
+    plugin = PagePlugin()
+    manager.add_plugin(plugin)
+    assert manager.has_plugins
+    manager.remove_plugin(plugin)
+    assert not manager.has_plugins
+
+
+def test_add_plugin_applies_to_existing_pages_and_contexts():
+    wrighter = FakeWrighter()
+    manager = PluginManager(wrighter)
+    page_plugin, context_plugin = PagePlugin(), ContextPlugin()
+    manager.add_plugin(page_plugin)
+    manager.add_plugin(context_plugin)
+    assert wrighter.pages[0].listeners == [("request", page_plugin.on_request)]
+    assert wrighter.contexts[0].listeners == [("page", context_plugin.on_page)]
+
+
+def test_remove_all_detaches_every_plugin():
+    wrighter = FakeWrighter()
+    manager = PluginManager(wrighter)
+    for plugin in (PagePlugin(), ContextPlugin(), ChildPlugin()):
+        manager.add_plugin(plugin)
+    manager.remove_all()
+    assert manager.plugins == ()
+    assert not manager.has_plugins
+    assert manager.get_plugins_by_class(Plugin) == []
+    assert wrighter.pages[0].listeners == []
+    assert wrighter.contexts[0].listeners == []
+
+
+def test_remove_all_without_existing_keeps_listeners():
+    wrighter = FakeWrighter()
+    manager = PluginManager(wrighter, [PagePlugin()])
+    manager.add_plugin(ChildPlugin())
+    manager.remove_all(existing=False)
+    assert len(wrighter.pages[0].listeners) == 1
+
+
+def test_get_plugins_by_class():
+    page_plugin, context_plugin, child = PagePlugin(), ContextPlugin(), ChildPlugin()
+    manager = PluginManager(FakeWrighter(), [page_plugin, context_plugin, child])
+    assert manager.get_plugins_by_class(PagePlugin) == [page_plugin, child]
+    assert manager.get_plugins_by_class(ChildPlugin) == [child]
+    assert manager.get_plugins_by_class(Plugin) == [page_plugin, context_plugin, child]
+    manager.remove_plugin(page_plugin, existing=False)
+    assert manager.get_plugins_by_class(PagePlugin) == [child]
+
+
+def test_get_plugins_by_class_matches_isinstance():
+    page_plugin, context_plugin = PagePlugin(), ContextPlugin()
+    manager = PluginManager(FakeWrighter(), [page_plugin, context_plugin])
+    plugins = manager.get_plugins_by_class((PagePlugin, ContextPlugin))  # type:ignore
+    assert plugins == [page_plugin, context_plugin]
+    assert manager.get_plugins_by_class(Marker) == [context_plugin]  # type:ignore
+    assert manager.get_plugins_by_class(ChildPlugin) == []
+
+
+class ScriptPlugin(Plugin):
+    init_script = "window.answer = 42;"
+
+
+def test_init_script_is_added_to_existing_contexts():
+    wrighter = FakeWrighter()
+    manager = PluginManager(wrighter)
+    manager.add_plugin(ScriptPlugin())
+    assert wrighter.contexts[0].init_scripts == ["(() => {\nwindow.answer = 42;\n})();"]
+    assert manager.init_script == wrighter.contexts[0].init_scripts[0]
+
+
+def test_init_script_is_not_added_without_existing():
+    wrighter = FakeWrighter()
+    PluginManager(wrighter).add_plugin(ScriptPlugin(), existing=False)
+    assert wrighter.contexts[0].init_scripts == []
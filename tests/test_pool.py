@@ -0,0 +1,138 @@
+import asyncio
+
+import pytest
+
+from conftest import FakeContext, run
+from wrighter.pool import ContextPool
+
+
+class Factory:
+    def __init__(self) -> None:
+        self.created: list[FakeContext] = []
+
+    async def __call__(self) -> FakeContext:
+        context = FakeContext()
+        self.created.append(context)
+        return context
+
+
+def test_context_is_reused():
+    async def main():
+        factory = Factory()
+        pool = ContextPool(factory, max_size=2)
+        async with pool.context() as first:
+            pass
+        async with pool.context() as second:
+            pass
+        assert first is second
+        assert len(factory.created) == 1
+        assert pool.idle == 1
+
+    run(main())
+
+
+def test_recycle_by_max_uses():
+    async def main():
+        factory = Factory()
+        pool = ContextPool(factory, max_size=1, max_uses=2)
+        for _ in range(2):
+            async with pool.context() as ctx:
+                pass
+        assert ctx.closed
+        assert pool.idle == 0
+        async with pool.context() as new_ctx:
+            pass
+        assert new_ctx is not ctx
+        assert len(factory.created) == 2
+
+    run(main())
+
+
+def test_recycle_by_max_age_on_release():
+    async def main():
+        factory = Factory()
+        pool = ContextPool(factory, max_size=1, max_age=5)
+        item = await pool.acquire()
+        item.created_at -= 10
+        await pool.release(item)
+        assert item.context.closed
+        assert pool.idle == 0
+
+    run(main())
+
+
+def test_expired_idle_context_is_replaced_on_acquire():
+    async def main():
+        factory = Factory()
+        pool = ContextPool(factory, max_size=1, max_age=5)
+        item = await pool.acquire()
+        await pool.release(item)
+        item.created_at -= 10
+        new_item = await pool.acquire()
+        assert item.context.closed
+        assert new_item is not item
+        await pool.release(new_item)
+
+    run(main())
+
+
+def test_max_size_bounds_concurrent_use():
+    async def main():
+        pool = ContextPool(Factory(), max_size=2)
+        first = await pool.acquire()
+        await pool.acquire()
+        waiter = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await pool.release(first)
+        third = await asyncio.wait_for(waiter, timeout=1)
+        assert third is first
+
+    run(main())
+
+
+def test_failed_creation_releases_slot():
+    async def main():
+        async def failing_factory():
+            raise RuntimeError("launch failed")
+
+        pool = ContextPool(failing_factory, max_size=1)
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await asyncio.wait_for(pool.acquire(), timeout=1)
+
+    run(main())
+
+
+def test_close_closes_idle_contexts():
+    async def main():
+        factory = Factory()
+        pool = ContextPool(factory, max_size=2)
+        a = await pool.acquire()
+        b = await pool.acquire()
+        await pool.release(a)
+        await pool.release(b)
+        await pool.close()
+        assert pool.idle == 0
+        assert all(ctx.closed for ctx in factory.created)
+
+    run(main())
+
+
+def test_fill_creates_min_size_contexts():
+    async def main():
+        factory = Factory()
+        pool = ContextPool(factory, max_size=4, min_size=3)
+        await pool.fill()
+        assert pool.idle == 3
+        await pool.fill()
+        assert len(factory.created) == 3
+
+    run(main())
+
+
+def test_invalid_sizes():
+    with pytest.raises(ValueError):
+        ContextPool(Factory(), max_size=0)
+    with pytest.raises(ValueError):
+        ContextPool(Factory(), max_size=2, min_size=3)
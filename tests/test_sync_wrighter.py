@@ -0,0 +1,168 @@
+from types import SimpleNamespace
+from typing import Callable
+
+import pytest
+
+import wrighter.sync_wrighter
+from conftest import FakeEmitter, FakePage
+from wrighter.constants import DEFAULT_RESOURCE_EXCLUSIONS
+from wrighter.plugin import Plugin, page
+from wrighter.sync_wrighter import SyncWrighter
+
+
+class FakeSyncContext(FakeEmitter):
+    def __init__(self, log: list[str]) -> None:
+        super().__init__()
+        self.log = log
+        self.pages = []
+        self.routes: list[tuple[str, Callable]] = []
+
+    def route(self, url: str, handler: Callable) -> None:
+        self.routes.append((url, handler))
+
+    def add_init_script(self, script: str) -> None:
+        pass
+
+    def close(self) -> None:
+        self.log.append("close context")
+
+
+class FakeBrowser:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+        self.contexts: list[FakeSyncContext] = []
+
+    def new_context(self, **kwargs) -> FakeSyncContext:
+        context = FakeSyncContext(self.log)
+        self.contexts.append(context)
+        return context
+
+    def close(self) -> None:
+        self.log.append("close browser")
+
+
+class FakePlaywright:
+    def __init__(self, driver: "FakeSyncPlaywright") -> None:
+        self.driver = driver
+        self.log = driver.log
+        self.devices = {"Desktop Chrome": {"user_agent": "Fake/1.0"}}
+        self.chromium = self.firefox = self.webkit = self
+
+    def launch(self, **kwargs) -> FakeBrowser:
+        if self.driver.fail_launch:
+            raise RuntimeError("browser executable missing")
+        return FakeBrowser(self.log)
+
+    def stop(self) -> None:
+        self.log.append("stop playwright")
+
+
+class FakeSyncPlaywright:
+    def __init__(self) -> None:
+        self.log: list[str] = []
+        self.fail_launch = False
+
+    def __call__(self):
+        return self
+
+    def start(self) -> FakePlaywright:
+        self.log.append("start playwright")
+        return FakePlaywright(self)
+
+
+@pytest.fixture
+def fake(monkeypatch):
+    fake = FakeSyncPlaywright()
+    monkeypatch.setattr(wrighter.sync_wrighter, "sync_playwright", fake)
+    return fake
+
+
+@pytest.fixture
+def options(tmp_path):
+    return {"data_dir": str(tmp_path)}
+
+
+def test_start_is_lazy(fake, options):
+    w = SyncWrighter(options)
+    assert fake.log == []
+    context = w.context
+    assert isinstance(context, FakeSyncContext)
+    assert w.browser.contexts == [context]
+    assert fake.log == ["start playwright"]
+
+
+def test_stop_closes_what_was_created(fake, options):
+    w = SyncWrighter(options)
+    w.context
+    w.stop()
+    w.stop()
+    assert fake.log == ["start playwright", "close context", "close browser", "stop playwright"]
+    assert w.contexts == []
+
+
+def test_stop_without_start(fake, options):
+    SyncWrighter(options).stop()
+    assert fake.log == []
+
+
+def test_failed_start_stops_playwright_and_can_be_retried(fake, options):
+    w = SyncWrighter(options)
+    fake.fail_launch = True
+    with pytest.raises(RuntimeError, match="browser executable missing"):
+        w.context
+    assert fake.log == ["start playwright", "stop playwright"]
+    fake.fail_launch = False
+    assert isinstance(w.context, FakeSyncContext)
+    assert fake.log.count("start playwright") == 2
+
+
+class FakeRoute:
+    def __init__(self, resource_type: str) -> None:
+        self.request = SimpleNamespace(resource_type=resource_type)
+        self.result = ""
+
+    def abort(self) -> None:
+        self.result = "abort"
+
+    def continue_(self) -> None:
+        self.result = "continue"
+
+
+def test_blocked_resources(options):
+    assert SyncWrighter(options).blocked_resources == frozenset()
+    w = SyncWrighter({**options, "block_resources": True})
+    assert w.blocked_resources == DEFAULT_RESOURCE_EXCLUSIONS
+    w = SyncWrighter({**options, "block_resources": ["Image", "font"]})
+    assert w.blocked_resources == {"image", "font"}
+
+
+def test_block_resources_routes_every_context(fake, options):
+    w = SyncWrighter({**options, "block_resources": ["image"]})
+    ((url, handler),) = w.context.routes
+    assert url == "**/*"
+    image, script = FakeRoute("image"), FakeRoute("script")
+    handler(image)
+    handler(script)
+    assert image.result == "abort"
+    assert script.result == "continue"
+
+
+def test_contexts_are_not_routed_without_block_resources(fake, options):
+    assert SyncWrighter(options).context.routes == []
+
+
+class RequestPlugin(Plugin):
+    @page("on", "request")
+    def on_request(self, request):
+        pass
+
+
+def test_new_pages_are_tracked_until_closed(fake, options):
+    plugin = RequestPlugin()
+    w = SyncWrighter(options, plugins=[plugin])
+    new_page = FakePage()
+    w.context.emit("page", new_page)
+    assert w.pages == [new_page]
+    assert ("request", plugin.on_request) in new_page.listeners
+    new_page.emit("close", new_page)
+    assert w.pages == []
@@ -1,18 +1,76 @@
+import importlib
 from pathlib import Path
-from typing import Any, Mapping
-
-from playwright._impl._api_structures import (
-    Cookie,
-    Geolocation,
-    HttpCredentials,
-    ProxySettings,
-    StorageState,
-    ViewportSize,
+from typing import TYPE_CHECKING, Any, Mapping
+
+from wrighter import constants
+
+if TYPE_CHECKING:
+    from playwright._impl._api_structures import (
+        Cookie,
+        Geolocation,
+        HttpCredentials,
+        ProxySettings,
+        StorageState,
+        ViewportSize,
+    )
+
+    from wrighter import (
+        async_wrighter,
+        core,
+        options,
+        page_pool,
+        plugin,
+        plugin_manager,
+        pool,
+        sync_wrighter,
+    )
+    from wrighter.async_wrighter import AsyncWrighter, install_uvloop
+    from wrighter.options import WrighterOptions, load_wrighter_opts
+    from wrighter.plugin import Plugin
+    from wrighter.plugin_manager import PluginManager
+    from wrighter.sync_wrighter import SyncWrighter
+
+# Attributes are imported on first access, so 'import wrighter' only loads the constants module.
+_LAZY_ATTRS = {
+    "Cookie": "playwright._impl._api_structures",
+    "Geolocation": "playwright._impl._api_structures",
+    "HttpCredentials": "playwright._impl._api_structures",
+    "ProxySettings": "playwright._impl._api_structures",
+    "StorageState": "playwright._impl._api_structures",
+    "ViewportSize": "playwright._impl._api_structures",
+    "AsyncWrighter": "wrighter.async_wrighter",
+    "install_uvloop": "wrighter.async_wrighter",
+    "WrighterOptions": "wrighter.options",
+    "load_wrighter_opts": "wrighter.options",
+    "Plugin": "wrighter.plugin",
+    "PluginManager": "wrighter.plugin_manager",
+    "SyncWrighter": "wrighter.sync_wrighter",
+}
+_LAZY_MODULES = (
+    "async_wrighter",
+    "core",
+    "options",
+    "page_pool",
+    "plugin",
+    "plugin_manager",
+    "pool",
+    "sync_wrighter",
 )
 
-from wrighter import constants, core
-from wrighter.async_wrighter import AsyncWrighter
-from wrighter.options import WrighterOptions, load_wrighter_opts
-from wrighter.plugin import Plugin
-from wrighter.plugin_manager import PluginManager
-from wrighter.sync_wrighter import SyncWrighter
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        value = getattr(importlib.import_module(_LAZY_ATTRS[name]), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | set(_LAZY_MODULES))
+
+
+__all__ = ["constants", *_LAZY_MODULES, *_LAZY_ATTRS]
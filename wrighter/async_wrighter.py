@@ -1,7 +1,7 @@
 import asyncio
-import random
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Mapping
 
 from playwright.async_api import (
     Browser,
@@ -15,7 +15,9 @@ from playwright.async_api import (
 
 from wrighter.core import WrighterCore
 from wrighter.options import WrighterOptions
+from wrighter.page_pool import PagePool
 from wrighter.plugin import Plugin
+from wrighter.pool import ContextPool
 
 
 class AsyncWrighter(WrighterCore):
@@ -25,6 +27,8 @@ class AsyncWrighter(WrighterCore):
         plugins: list[Plugin] | None = None,
     ) -> None:
         super().__init__(options, plugins)
+        self.context_pool: ContextPool | None = None
+        self.page_pool: PagePool | None = None
 
     async def start(self):
         """
@@ -32,9 +36,32 @@ class AsyncWrighter(WrighterCore):
         Starts the Playwright instance, launches a browser, and creates a browser context.
         """
         self.playwright: Playwright = await self.__start_playwright()
-        self.browser: Browser | BrowserContext = await self._launch_browser()
-        self.context: BrowserContext = await self.__launch_context()
-        self._resolve_options()
+        try:
+            self._init_drivers()
+            self._resolve_options()
+            self.browser: Browser | BrowserContext = await self._launch_browser()
+            self.context: BrowserContext = await self.__launch_context()
+            self.page_pool = PagePool(
+                self.context,
+                max_pages=self.options.max_pages,
+                reset_between_uses=self.options.reset_pages,
+            )
+            if not self.is_persistent:
+                self.context_pool = ContextPool(
+                    self.new_context,
+                    max_size=self.options.context_pool_size,
+                    max_uses=self.options.context_max_uses,
+                    max_age=self.options.context_max_age,
+                    min_size=self.options.context_pool_min_size,
+                )
+                await self.context_pool.fill()
+        except BaseException:
+            # Stop Playwright so that the instance can be started again
+            try:
+                await self.stop()
+            except Exception:
+                pass
+            raise
 
     async def __start_playwright(self):
         return await async_playwright().start()
@@ -56,8 +83,7 @@ class AsyncWrighter(WrighterCore):
         if self.is_persistent:
             opts = self.options.persistent_context_options
             browser_context = await driver.launch_persistent_context(**opts)  # type:ignore
-            browser_context.on("page", lambda page: self.plugin_manager.page_apply_plugins(page))
-            self.plugin_manager.context_apply_plugins(browser_context)
+            await self._setup_context(browser_context)
             return browser_context
         return await driver.launch(**self.options.browser_launch_options)  # type:ignore
 
@@ -78,15 +104,109 @@ class AsyncWrighter(WrighterCore):
         if self.is_persistent:
             raise RuntimeError("Cannot create contexts in persistent mode.")
         context = await self.browser.new_context(**self.options.context_options)  # type:ignore
-        context.on("page", lambda page: self.plugin_manager.page_apply_plugins(page))
-        self.plugin_manager.context_apply_plugins(context)
+        await self._setup_context(context)
         return context
 
+    async def _setup_context(self, context: BrowserContext) -> None:
+        """Applies request interception and plugins to a newly launched context."""
+        blocked = self.blocked_resources
+        if blocked:
+            await context.route("**/*", self._resource_blocker(blocked))
+        init_script = self.plugin_manager.init_script
+        if init_script:
+            await context.add_init_script(init_script)
+        for page in context.pages:
+            self._track_page(page)
+        context.on("page", self._on_page)
+        if self.plugin_manager.has_plugins:
+            self.plugin_manager.context_apply_plugins(context)
+
+    def _resource_blocker(self, blocked: frozenset[str]):
+        async def handler(route: Route) -> None:
+            if route.request.resource_type in blocked:
+                await route.abort()
+            else:
+                await route.continue_()
+
+        return handler
+
+    @asynccontextmanager
+    async def acquire_context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Acquires a warm context from the context pool and returns it to the pool when done.
+        Contexts are recycled based on the `context_max_uses` and `context_max_age` options.
+        `context_pool_min_size` contexts are created in advance when the instance is started.
+
+        Raises:
+            RuntimeError: if you try to acquire a context in peristent mode. (if 'user_data_dir' is set)
+
+        Example:
+        --------
+        >>> async with wrighter.acquire_context() as ctx:
+        >>>     page = await ctx.new_page()
+        """
+        if self.is_persistent:
+            raise RuntimeError("Cannot acquire contexts in persistent mode.")
+        if self.context_pool is None:
+            raise RuntimeError("'start' must be called before acquiring contexts.")
+        async with self.context_pool.context() as context:
+            yield context
+
+    async def gather_urls(
+        self,
+        urls: Iterable[str],
+        handler: Callable[[Page, str], Awaitable[Any]],
+        concurrency: int = 8,
+    ) -> list[Any]:
+        """
+        Runs `handler(page, url)` for every URL with at most `concurrency` handlers running at once.
+        Pages are taken from the page pool, so `concurrency` should not exceed the `max_pages` option.
+
+        Args:
+            urls (Iterable[str]): The URLs to process.
+            handler (Callable): Coroutine function that receives a page and a URL.
+            concurrency (int, optional): The maximum number of concurrently running handlers. Defaults to 8.
+
+        Returns:
+            list: Handler results in the order of `urls`. Exceptions raised by handlers are returned, not raised.
+
+        Raises:
+            RuntimeError: if `start` was not called.
+        """
+        if self.page_pool is None:
+            raise RuntimeError("'start' must be called before gathering URLs.")
+        page_pool = self.page_pool
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(url: str):
+            async with semaphore:
+                async with page_pool.acquire() as page:
+                    return await handler(page, url)
+
+        return await asyncio.gather(*[run(url) for url in urls], return_exceptions=True)
+
     async def stop(self):
+        """Closes the pools, context and browser that were created and stops Playwright."""
+        if self.playwright is ...:
+            return
         self.logger.debug("Stopping Playwright")
-        await self.context.close()
-        await self.browser.close()  # type: ignore
-        await self.playwright.stop()  # type: ignore
+        try:
+            if self.page_pool is not None:
+                await self.page_pool.close()
+            if self.context_pool is not None:
+                await self.context_pool.close()
+            if self.context is not ...:
+                await self.context.close()
+            if self.browser is not ...:
+                await self.browser.close()  # type: ignore
+        finally:
+            playwright = self.playwright
+            self.page_pool = None
+            self.context_pool = None
+            self.context = ...  # type:ignore
+            self.browser = ...  # type:ignore
+            self.playwright = ...  # type:ignore
+            await playwright.stop()  # type: ignore
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         try:
@@ -94,6 +214,22 @@ class AsyncWrighter(WrighterCore):
         except Exception:
             pass
 
+    async def export_storage_state(self) -> None:
+        """
+        Exports the storage state for all contexts concurrently.
+
+        The storage state for each context is saved to a JSON file in the default data directory.
+        The file name includes an index indicating the context it belongs to.
+
+        Returns:
+            None
+        """
+        contexts = self.contexts
+        paths = self._storage_state_paths(len(contexts))
+        await asyncio.gather(*[ctx.storage_state(path=p) for ctx, p in zip(contexts, paths)])
+        for i, filepath in enumerate(paths):
+            self.logger.info("Context {} saved", i, path=filepath)
+
     async def sleep(self, lo: float, hi: float | None = None) -> float:
         """
         Sleeps for a random duration within a specified range.
@@ -109,16 +245,26 @@ class AsyncWrighter(WrighterCore):
             ValueError: If `hi` is provided and `lo` is greater than `hi`.
         """
 
-        if hi is None:
-            await asyncio.sleep(lo)
-            self.logger.info(f"Sleeping for {round(lo,2)}s")
-            return lo
-        if lo > hi:
-            raise ValueError(f"Minimum sleep time is higher that maximum. {(lo,hi)}")
-        t = random.uniform(lo, hi)
-        self.logger.info(f"Sleeping for {round(t,2)}s")
+        t = self._sleep_duration(lo, hi)
+        self.logger.opt(lazy=True).info("Sleeping for {}s", lambda: round(t, 2))
         await asyncio.sleep(t)
         return t
 
 
-__all__ = ["AsyncWrighter"]
+def install_uvloop() -> bool:
+    """
+    Sets uvloop's event loop policy if uvloop is installed.
+    Must be called before the event loop is created, e.g. before `asyncio.run`.
+
+    Returns:
+        bool: `True` if uvloop is used, `False` if it is not installed.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+__all__ = ["AsyncWrighter", "install_uvloop"]
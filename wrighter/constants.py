@@ -1,103 +1,117 @@
-PERMISSIONS = [
-    "geolocation",
-    "midi",
-    "midi-sysex",
-    "notifications",
-    "camera",
-    "microphone",
-    "background-sync",
-    "ambient-light-sensor",
-    "accelerometer",
-    "gyroscope",
-    "magnetometer",
-    "accessibility-events",
-    "clipboard-read",
-    "clipboard-write",
-    "payment-handler",
-]
+PERMISSIONS = frozenset(
+    {
+        "geolocation",
+        "midi",
+        "midi-sysex",
+        "notifications",
+        "camera",
+        "microphone",
+        "background-sync",
+        "ambient-light-sensor",
+        "accelerometer",
+        "gyroscope",
+        "magnetometer",
+        "accessibility-events",
+        "clipboard-read",
+        "clipboard-write",
+        "payment-handler",
+    }
+)
 
-CHANNELS = [
-    "chrome",
-    "chrome-beta",
-    "chrome-dev",
-    "chrome-canary",
-    "msedge",
-    "msedge-beta",
-    "msedge-dev",
-    "msedge-canary",
-]
+CHANNELS = frozenset(
+    {
+        "chrome",
+        "chrome-beta",
+        "chrome-dev",
+        "chrome-canary",
+        "msedge",
+        "msedge-beta",
+        "msedge-dev",
+        "msedge-canary",
+    }
+)
 
-RESOURCE_TYPES = [
-    "document",
-    "stylesheet",
-    "image",
-    "media",
-    "font",
-    "script",
-    "texttrack",
-    "xhr",
-    "fetch",
-    "eventsource",
-    "websocket",
-    "manifest",
-    "other",
-]
+RESOURCE_TYPES = frozenset(
+    {
+        "document",
+        "stylesheet",
+        "image",
+        "media",
+        "font",
+        "script",
+        "texttrack",
+        "xhr",
+        "fetch",
+        "eventsource",
+        "websocket",
+        "manifest",
+        "other",
+    }
+)
 
-BROWSER_LAUNCH_OPTS_NAMES = [
-    "executable_path",
-    "channel",
-    "args",
-    "ignore_default_args",
-    "handle_sigint",
-    "handle_sigterm",
-    "handle_sighup",
-    "timeout",
-    "env",
-    "headless",
-    "devtools",
-    "proxy",
-    "downloads_path",
-    "slow_mo",
-    "traces_dir",
-    "chromium_sandbox",
-    "firefox_user_prefs",
-]
+DEFAULT_RESOURCE_EXCLUSIONS = frozenset({"image", "stylesheet", "media", "font", "other"})
 
-CONTEXT_OPTS_NAMES = [
-    "viewport",
-    "screen",
-    "no_viewport",
-    "ignore_https_errors",
-    "java_script_enabled",
-    "bypass_csp",
-    "user_agent",
-    "locale",
-    "timezone_id",
-    "geolocation",
-    "permissions",
-    "extra_http_headers",
-    "offline",
-    "http_credentials",
-    "device_scale_factor",
-    "is_mobile",
-    "has_touch",
-    "color_scheme",
-    "reduced_motion",
-    "forced_colors",
-    "accept_downloads",
-    "proxy",
-    "record_har_path",
-    "record_har_omit_content",
-    "record_video_dir",
-    "record_video_size",
-    "storage_state",
-    "base_url",
-    "strict_selectors",
-    "service_workers",
-    "record_har_url_filter",
-    "record_har_mode",
-    "record_har_content",
-]
+BROWSER_LAUNCH_OPTS_NAMES = frozenset(
+    {
+        "executable_path",
+        "channel",
+        "args",
+        "ignore_default_args",
+        "handle_sigint",
+        "handle_sigterm",
+        "handle_sighup",
+        "timeout",
+        "env",
+        "headless",
+        "devtools",
+        "proxy",
+        "downloads_path",
+        "slow_mo",
+        "traces_dir",
+        "chromium_sandbox",
+        "firefox_user_prefs",
+    }
+)
 
+CONTEXT_OPTS_NAMES = frozenset(
+    {
+        "viewport",
+        "screen",
+        "no_viewport",
+        "ignore_https_errors",
+        "java_script_enabled",
+        "bypass_csp",
+        "user_agent",
+        "locale",
+        "timezone_id",
+        "geolocation",
+        "permissions",
+        "extra_http_headers",
+        "offline",
+        "http_credentials",
+        "device_scale_factor",
+        "is_mobile",
+        "has_touch",
+        "color_scheme",
+        "reduced_motion",
+        "forced_colors",
+        "accept_downloads",
+        "proxy",
+        "record_har_path",
+        "record_har_omit_content",
+        "record_video_dir",
+        "record_video_size",
+        "storage_state",
+        "base_url",
+        "strict_selectors",
+        "service_workers",
+        "record_har_url_filter",
+        "record_har_mode",
+        "record_har_content",
+    }
+)
 
-BROWSERS = ["firefox", "chromium", "webkit"]
+# 'storage_state' is not supported by persistent contexts
+PERSISTENT_CONTEXT_OPTS_NAMES = (BROWSER_LAUNCH_OPTS_NAMES | CONTEXT_OPTS_NAMES) - {"storage_state"}
+
+BROWSERS = frozenset({"firefox", "chromium", "webkit"})
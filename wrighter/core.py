@@ -1,16 +1,16 @@
 import os
+import random
 import sys
 from pathlib import Path
 from typing import Any, Mapping
 
 from loguru import logger
-from playwright.async_api import Browser as AsyncBrowser
-from playwright.async_api import BrowserContext as AsyncBrowserContext
+from playwright._impl._browser_context import BrowserContext as BrowserContextImpl
 from playwright.sync_api import Browser, BrowserContext, BrowserType, Page, Playwright
 from stdl import fs
-from stdl.fs import SEP
 from stdl.log import br, loguru_formater
 
+from wrighter.constants import DEFAULT_RESOURCE_EXCLUSIONS
 from wrighter.options import WrighterOptions, load_wrighter_opts
 from wrighter.plugin import Plugin
 from wrighter.plugin_manager import PluginManager
@@ -30,18 +30,35 @@ class WrighterCore:
         self.context: BrowserContext = ...  # type:ignore
         self.logger = logger
         self.options = load_wrighter_opts(options)
-        self.plugin_manager = PluginManager(self)
+        self.plugin_manager = PluginManager(self, plugins)
+        self._ua_cache: dict[str, str] = {}
+        self._pages: list[Page] = []
+        self._drivers: dict[str, BrowserType] = {}
+        self._rng = random.Random()
 
-        if plugins:
-            self.plugin_manager.plugins.extend(plugins)
+    def add_plugin(self, plugin: Plugin, *, existing=True) -> None:
+        """Adds a plugin. See `PluginManager.add_plugin`."""
+        self.plugin_manager.add_plugin(plugin, existing=existing)
 
-        self.add_plugin = self.plugin_manager.add_plugin
-        self.remove_plugin = self.plugin_manager.remove_plugin
-        self.remove_all_plugins = self.plugin_manager.remove_all
-        self._page_apply_plugins = self.plugin_manager.page_apply_plugins
-        self._context_apply_plugins = self.plugin_manager.context_apply_plugins
-        self.get_plugins_by_class = self.plugin_manager.get_plugins_by_class
-        self.print_plugins = self.plugin_manager.print_plugins
+    def remove_plugin(self, plugin: Plugin, *, existing=True) -> None:
+        """Removes a plugin. See `PluginManager.remove_plugin`."""
+        self.plugin_manager.remove_plugin(plugin, existing=existing)
+
+    def remove_all_plugins(self, *, existing=True) -> None:
+        """Removes all plugins. See `PluginManager.remove_all`."""
+        self.plugin_manager.remove_all(existing=existing)
+
+    def get_plugins_by_class(self, cls: type[Plugin]) -> list[Plugin]:
+        return self.plugin_manager.get_plugins_by_class(cls)  # type:ignore
+
+    def print_plugins(self) -> None:
+        self.plugin_manager.print_plugins()
+
+    def _page_apply_plugins(self, page: Page) -> None:
+        self.plugin_manager.page_apply_plugins(page)
+
+    def _context_apply_plugins(self, ctx: BrowserContext) -> None:
+        self.plugin_manager.context_apply_plugins(ctx)
 
     def export_storage_state(self) -> None:
         """
@@ -53,11 +70,19 @@ class WrighterCore:
         Returns:
             None
         """
-        for i, ctx in enumerate(self.contexts):
-            filename = str(i) + "." + fs.rand_filename("storage_state", "json")
-            filepath = str(self.options.data_dir) + SEP + filename
+        contexts = self.contexts
+        paths = self._storage_state_paths(len(contexts))
+        for i, (ctx, filepath) in enumerate(zip(contexts, paths)):
             ctx.storage_state(path=filepath)
-            self.logger.info(f"Context {i} saved", path=filepath)
+            self.logger.info("Context {} saved", i, path=filepath)
+
+    def _storage_state_paths(self, count: int) -> list[str]:
+        """Returns `count` storage state file paths in the default data directory."""
+        paths = []
+        for i in range(count):
+            filename = str(i) + "." + fs.rand_filename("storage_state", "json")
+            paths.append(os.path.join(self.data_dir, filename))
+        return paths
 
     def export_options(self, path: str | Path | None = None, *, full=False) -> None:
         """
@@ -72,7 +97,7 @@ class WrighterCore:
             None
         """
         if path is None:
-            path = str(self.options.data_dir) + SEP + fs.rand_filename("wrighter_options", "json")
+            path = os.path.join(self.data_dir, fs.rand_filename("wrighter_options", "json"))
         self.options.export(path, full=full)
         self.logger.info(f"{self.options.__class__.__name__} exported", path=path)
 
@@ -94,10 +119,14 @@ class WrighterCore:
         >>> "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/90.0.4430.212 Safari/537.36"
 
         """
-        browser_name = browser_name.capitalize()
-        if browser_name == "Chromium":
-            browser_name = "Chrome"
-        return self.playwright.devices[f"Desktop {browser_name}"]["user_agent"]
+        if browser_name in self._ua_cache:
+            return self._ua_cache[browser_name]
+        device_name = browser_name.capitalize()
+        if device_name == "Chromium":
+            device_name = "Chrome"
+        ua = self.playwright.devices[f"Desktop {device_name}"]["user_agent"]
+        self._ua_cache[browser_name] = ua
+        return ua
 
     def _resolve_options(self):
         if self.options.user_agent is None and self.options.force_user_agent:
@@ -120,25 +149,51 @@ class WrighterCore:
             str: The path to the internal directory.
         """
 
-        directory = str(self.options.data_dir) + SEP + folder_name
-        if not os.path.exists(directory):
-            os.makedirs(directory)
+        directory = os.path.join(self.data_dir, folder_name)
+        os.makedirs(directory, exist_ok=True)
         return directory
 
+    def _init_drivers(self) -> None:
+        """Maps browser names to browser types. Must be called after Playwright is started."""
+        self._drivers = {
+            "chromium": self.playwright.chromium,
+            "firefox": self.playwright.firefox,
+            "webkit": self.playwright.webkit,
+        }
+
     def _get_driver(self, browser: str) -> BrowserType:
-        match browser.lower():
-            case "chromium":
-                return self.playwright.chromium
-            case "firefox":
-                return self.playwright.firefox
-            case "webkit":
-                return self.playwright.webkit
-            case _:
-                raise ValueError(f"Invalid browser name: {browser}")
+        try:
+            return self._drivers[browser.lower()]
+        except KeyError:
+            raise ValueError(f"Invalid browser name: {browser}") from None
+
+    def _sleep_duration(self, lo: float, hi: float | None = None) -> float:
+        """Returns `lo` if `hi` is not provided, otherwise a random duration between `lo` and `hi`."""
+        if hi is None:
+            return lo
+        if lo > hi:
+            raise ValueError(f"Minimum sleep time is higher that maximum. {(lo,hi)}")
+        return self._rng.uniform(lo, hi)
+
+    def _track_page(self, page: Page) -> None:
+        self._pages.append(page)
+        page.on("close", self._on_page_close)
+
+    def _on_page(self, page: Page) -> None:
+        """Handler for the context 'page' event. Tracks the page and applies plugins to it."""
+        self._track_page(page)
+        if self.plugin_manager.has_plugins:
+            self.plugin_manager.page_apply_plugins(page)
+
+    def _on_page_close(self, page: Page) -> None:
+        if page in self._pages:
+            self._pages.remove(page)
 
     def _provided_dir_or_default(self, path: str | Path | None) -> str:
         """Returns the provided directory or the default data directory."""
-        return str(path) if path is not None else self.options.data_dir  # type:ignore
+        if isinstance(path, str):
+            return path
+        return os.fspath(path) if path is not None else self.options.data_dir  # type:ignore
 
     @property
     def is_persistent(self) -> bool:
@@ -153,22 +208,43 @@ class WrighterCore:
         """
         return self.options.user_data_dir is not None
 
+    @property
+    def blocked_resources(self) -> frozenset[str]:
+        """
+        Returns the resource types that are aborted by the request interceptor.
+        Depends on the `block_resources` option. If it is `True`, `DEFAULT_RESOURCE_EXCLUSIONS` are blocked.
+        """
+        block = self.options.block_resources
+        if not block:
+            return frozenset()
+        if block is True:
+            return DEFAULT_RESOURCE_EXCLUSIONS
+        return frozenset(block)
+
+    @property
+    def browser(self) -> Browser | BrowserContext:
+        return self._browser
+
+    @browser.setter
+    def browser(self, value: Browser | BrowserContext) -> None:
+        self._browser = value
+        # Sync and async API objects wrap the same implementation class
+        impl = getattr(value, "_impl_obj", None)
+        self._browser_is_context = isinstance(impl, BrowserContextImpl)
+
     @property
     def contexts(self) -> list[BrowserContext]:
         """Returns all open contexts."""
-        if isinstance(self.browser, (Browser, AsyncBrowser)):
-            return self.browser.contexts
-        elif isinstance(self.browser, (BrowserContext, AsyncBrowserContext)):
-            return [self.browser]
-        raise TypeError(self.browser)
+        if self._browser_is_context:
+            return [self._browser]  # type:ignore
+        if self._browser is ...:
+            return []
+        return self._browser.contexts  # type:ignore
 
     @property
     def pages(self) -> list[Page]:
-        """Returns open pages across all contexts."""
-        pages = []
-        for context in self.contexts:
-            pages.extend(context.pages)
-        return pages
+        """Returns open pages across all contexts launched by this instance."""
+        return list(self._pages)
 
     @property
     def data_dir(self) -> str:
@@ -0,0 +1,141 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Iterable, Mapping
+
+from aiomultiprocess import Pool
+from aiomultiprocess.pool import PoolWorker
+from playwright.async_api import Page
+
+from wrighter.async_wrighter import AsyncWrighter
+from wrighter.options import WrighterOptions
+
+_options: str | Path | Mapping[str, Any] | None | WrighterOptions = None
+_wrighter: AsyncWrighter | None = None
+_lock: asyncio.Lock | None = None
+
+
+def _init_process(options: str | Path | Mapping[str, Any] | None | WrighterOptions) -> None:
+    global _options, _lock
+    _options = options
+    _lock = asyncio.Lock()
+
+
+async def _get_wrighter() -> AsyncWrighter:
+    """Returns the wrighter of the current process, starting it on first use."""
+    global _wrighter
+    async with _lock:  # type:ignore
+        if _wrighter is None:
+            wrighter = AsyncWrighter(_options)
+            await wrighter.start()
+            _wrighter = wrighter
+    return _wrighter
+
+
+async def _stop_wrighter() -> None:
+    global _wrighter
+    if _wrighter is not None:
+        wrighter, _wrighter = _wrighter, None
+        await wrighter.stop()
+
+
+async def _run(handler: Callable[[Page, str], Awaitable[Any]], url: str) -> Any:
+    wrighter = await _get_wrighter()
+    async with wrighter.page_pool.acquire() as page:  # type:ignore
+        return await handler(page, url)
+
+
+class _Worker(PoolWorker):
+    """Pool worker that stops the wrighter of its process before the process exits."""
+
+    async def run(self) -> None:
+        try:
+            await super().run()
+        finally:
+            await _stop_wrighter()
+
+
+class _Pool(Pool):
+    def create_worker(self, qid):
+        # Same as Pool.create_worker in aiomultiprocess 0.9 (pinned in pyproject.toml),
+        # but with the worker class that stops its wrighter
+        tx, rx = self.queues[qid]
+        process = _Worker(
+            tx,
+            rx,
+            self.maxtasksperchild,
+            self.childconcurrency,
+            initializer=self.initializer,
+            initargs=self.initargs,
+            loop_initializer=self.loop_initializer,
+            exception_handler=self.exception_handler,
+        )
+        process.start()
+        return process
+
+
+class WrighterPool:
+    """
+    Runs an `AsyncWrighter` with its own event loop in each of several worker processes.
+    When the pool exits, workers finish their pending tasks and stop their wrighters before exiting.
+
+    Args:
+        options (optional): Options for the `AsyncWrighter` started in every process.
+        processes (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        per_proc_concurrency (int, optional): The maximum number of handlers running at once in each process.
+            Should not exceed the `max_pages` option. Defaults to 8.
+
+    Example:
+    --------
+    >>> async with WrighterPool(options) as pool:
+    >>>     results = await pool.map(handler, urls)
+    """
+
+    def __init__(
+        self,
+        options: str | Path | Mapping[str, Any] | None | WrighterOptions = None,
+        processes: int | None = None,
+        per_proc_concurrency: int = 8,
+    ) -> None:
+        self.options = options
+        self.processes = processes or os.cpu_count() or 1
+        self.per_proc_concurrency = per_proc_concurrency
+        self._pool: Pool | None = None
+
+    async def __aenter__(self):
+        self._pool = _Pool(
+            processes=self.processes,
+            childconcurrency=self.per_proc_concurrency,
+            initializer=_init_process,
+            initargs=(self.options,),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        # Let the workers finish their tasks and stop their wrighters instead of terminating them
+        pool.close()
+        try:
+            await pool.join()
+        except BaseException:
+            pool.terminate()
+            raise
+
+    async def map(
+        self, handler: Callable[[Page, str], Awaitable[Any]], urls: Iterable[str]
+    ) -> list[Any]:
+        """
+        Runs `handler(page, url)` for every URL across the worker processes.
+        The handler must be a module-level coroutine function so it can be pickled.
+
+        Returns:
+            list: Handler results in the order of `urls`.
+        """
+        if self._pool is None:
+            raise RuntimeError("WrighterPool must be used as an async context manager.")
+        return await self._pool.starmap(_run, [(handler, url) for url in urls])
+
+
+__all__ = ["WrighterPool"]
@@ -1,7 +1,8 @@
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Literal, Mapping
+from typing import Any, ClassVar, Literal, Mapping
 
 from loguru import logger as log
 from playwright._impl._api_structures import (
@@ -11,11 +12,24 @@ from playwright._impl._api_structures import (
     StorageState,
     ViewportSize,
 )
-from pydantic import BaseModel, validator
+from pydantic import BaseModel, PrivateAttr, validator
 from stdl import fs
 from stdl.st import FG, colored
 
-from wrighter.constants import BROWSER_LAUNCH_OPTS_NAMES, BROWSERS, CONTEXT_OPTS_NAMES, PERMISSIONS
+from wrighter.constants import (
+    BROWSER_LAUNCH_OPTS_NAMES,
+    BROWSERS,
+    CONTEXT_OPTS_NAMES,
+    PERMISSIONS,
+    PERSISTENT_CONTEXT_OPTS_NAMES,
+    RESOURCE_TYPES,
+)
+
+
+@lru_cache(maxsize=None)
+def _field_labels(cls: type[BaseModel]) -> dict[str, str]:
+    """Returns the printable labels of the fields of an options class."""
+    return {k: k.replace("_", " ").capitalize() for k in cls.model_fields}
 
 
 class BaseOptions(BaseModel):
@@ -36,14 +50,19 @@ class BaseOptions(BaseModel):
         """
         excl_unset = not full
         excl_defaults = not full
-        data = self.model_dump(exclude_unset=excl_unset, exclude_defaults=excl_defaults)
-        fs.json_dump(data, path=path)
+        data = self.model_dump_json(
+            indent=4, exclude_unset=excl_unset, exclude_defaults=excl_defaults
+        )
+        with open(os.fspath(path), "w", encoding="utf-8") as f:
+            f.write(data)
 
     def print(self, *, full=False):
         print(colored(self.__class__.__name__, color=FG.LIGHT_BLUE) + ":")
-        for k, v in self.dict(exclude_none=not full).items():
-            k = k.replace("_", " ").capitalize()
-            print(f"\t{k}: {v}")
+        for k, label in _field_labels(type(self)).items():
+            v = getattr(self, k)
+            if v is None and not full:
+                continue
+            print(f"\t{label}: {v}")
 
 
 class WrighterOptions(BaseOptions):
@@ -51,6 +70,16 @@ class WrighterOptions(BaseOptions):
     browser: str = "chromium"
     user_data_dir: str | Path | None = None
     force_user_agent: bool = True
+    # Context pool options
+    context_pool_size: int = 4
+    context_pool_min_size: int = 0
+    context_max_uses: int | None = None
+    context_max_age: float | None = None
+    # Page pool options
+    max_pages: int = 8
+    reset_pages: bool = False
+    # Request interception options
+    block_resources: bool | list[str] | None = None
     # Browser launch options
     executable_path: str | Path | None = None
     channel: str | None = None
@@ -104,6 +133,39 @@ class WrighterOptions(BaseOptions):
     record_har_mode: Literal["full", "minimal"] | None = None
     record_har_content: Literal["attach", "embed", "omit"] | None = None
 
+    check_paths: ClassVar[bool] = os.environ.get("WRIGHTER_SKIP_PATH_CHECK") != "1"
+    """Whether path options must exist. Disabled by setting `WRIGHTER_SKIP_PATH_CHECK=1`."""
+
+    _options_cache: dict[frozenset[str], dict[str, Any]] = PrivateAttr(default_factory=dict)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        if not name.startswith("_"):
+            self._options_cache.clear()
+
+    # Copies must not share the cache, 'model_copy(update=...)' bypasses __setattr__
+    def __copy__(self):
+        copied = super().__copy__()
+        copied._options_cache = {}
+        return copied
+
+    def __deepcopy__(self, memo: dict[int, Any] | None = None):
+        copied = super().__deepcopy__(memo)
+        copied._options_cache = {}
+        return copied
+
+    def _collect(self, names: frozenset[str]) -> dict[str, Any]:
+        """Returns the values of the given fields that are not `None`. Cached until an option changes."""
+        opts = self._options_cache.get(names)
+        if opts is None:
+            opts = {}
+            for name in names:
+                value = getattr(self, name)
+                if value is not None:
+                    opts[name] = value
+            self._options_cache[names] = opts
+        return dict(opts)
+
     @property
     def browser_launch_options(self) -> dict[str, Any]:
         """
@@ -111,7 +173,7 @@ class WrighterOptions(BaseOptions):
         These options are documented at:
         https://playwright.dev/python/docs/api/class-browsertype#browser-type-launch
         """
-        return {k: v for k, v in self.dict().items() if k in BROWSER_LAUNCH_OPTS_NAMES}
+        return self._collect(BROWSER_LAUNCH_OPTS_NAMES)
 
     @property
     def context_options(self) -> dict[str, Any]:
@@ -120,7 +182,7 @@ class WrighterOptions(BaseOptions):
         These options are documented at:
         https://playwright.dev/python/docs/api/class-browser#browser-new-context
         """
-        return {k: v for k, v in self.dict().items() if k in CONTEXT_OPTS_NAMES}
+        return self._collect(CONTEXT_OPTS_NAMES)
 
     @property
     def persistent_context_options(self) -> dict[str, Any]:
@@ -129,17 +191,12 @@ class WrighterOptions(BaseOptions):
         These options are documented at:
         https://playwright.dev/python/docs/api/class-browsertype#browser-type-launch-persistent-context
         """
-        opts = {
-            k: v
-            for k, v in self.dict().items()
-            if k in BROWSER_LAUNCH_OPTS_NAMES or k in CONTEXT_OPTS_NAMES
-        }
-        if "storage_state" in opts.keys():
+        if self.storage_state is not None:
             log.warning(
                 "'storage_state' is ignored when launching a browser with a persitent context",
-                storage_state=opts["storage_state"],
+                storage_state=self.storage_state,
             )
-            del opts["storage_state"]
+        opts = self._collect(PERSISTENT_CONTEXT_OPTS_NAMES)
         opts["user_data_dir"] = self.user_data_dir
         return opts
 
@@ -149,15 +206,25 @@ class WrighterOptions(BaseOptions):
         if v == "chrome":
             v = "chromium"
         if v not in BROWSERS:
-            raise ValueError(f"Possible values for 'browser' are {BROWSERS}")
+            raise ValueError(f"Possible values for 'browser' are {sorted(BROWSERS)}")
         return v
 
-    @validator("permissions", each_item=True)
+    @validator("permissions")
     def __validate_permissions(cls, v):
-        if isinstance(v, str):
-            v = v.lower()
-            if v not in PERMISSIONS:
-                raise ValueError(v)
+        if isinstance(v, list):
+            v = [i.lower() for i in v]
+            invalid = set(v).difference(PERMISSIONS)
+            if invalid:
+                raise ValueError(f"Invalid permissions: {sorted(invalid)}")
+        return v
+
+    @validator("block_resources")
+    def __validate_block_resources(cls, v):
+        if isinstance(v, list):
+            v = [i.lower() for i in v]
+            invalid = set(v).difference(RESOURCE_TYPES)
+            if invalid:
+                raise ValueError(f"Invalid resource types: {sorted(invalid)}")
         return v
 
     @validator("viewport", "screen", "record_video_size")
@@ -178,12 +245,13 @@ class WrighterOptions(BaseOptions):
         "storage_state",
     )
     def __validate_path(cls, v):
-        fs.ensure_paths_exist(v)
-        return os.path.abspath(str(v))
+        if cls.check_paths:
+            fs.ensure_paths_exist(v)
+        return os.path.abspath(os.fspath(v))
 
 
 def load_wrighter_opts(
-    opts: str | Path | Mapping[str, Any] | None | WrighterOptions
+    opts: str | Path | Mapping[str, Any] | None | WrighterOptions, *, trusted: bool = False
 ) -> WrighterOptions:
     """
     - If the input is `None`, returns a default `WrighterOptions` object.
@@ -191,12 +259,20 @@ def load_wrighter_opts(
     - If the input is a mapping, returns a `WrighterOptions` object constructed from the mapping.
     - If the input is already a `WrighterOptions` object, returns the object itself.
     - Otherwise, raises a `TypeError`.
+
+    If `trusted` is `True`, files and mappings are loaded without validation.
+    Only use it for input that was already validated, such as files written by `WrighterOptions.export`.
     """
     if opts is None:
         return WrighterOptions()
     elif isinstance(opts, (str, Path)):
+        if trusted:
+            with open(opts, "r", encoding="utf-8") as f:
+                return WrighterOptions.model_construct(**json.load(f))
         return WrighterOptions.parse_file(opts)
     elif isinstance(opts, Mapping):
+        if trusted:
+            return WrighterOptions.model_construct(**opts)
         return WrighterOptions(**opts)
     elif isinstance(opts, WrighterOptions):
         return opts
@@ -0,0 +1,87 @@
+import asyncio
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from playwright.async_api import BrowserContext, Page
+
+
+class PagePool:
+    """
+    Reuses pages (tabs) of a browser context across tasks instead of opening a new page for each one.
+    Plugins are applied by the context when a page is created, so reused pages are not set up again.
+
+    Args:
+        context (BrowserContext): The context to open pages in.
+        max_pages (int): The maximum number of pages that can be in use at the same time.
+        reuse_pages (bool): If `False`, pages are closed after use instead of being returned to the pool.
+        reset_between_uses (bool): If `True`, navigates released pages to 'about:blank'.
+            Cookies and storage belong to the context and are shared by all of its pages, so they are not reset.
+            Use a separate context per task (e.g. `AsyncWrighter.acquire_context`) if tasks must be isolated.
+    """
+
+    def __init__(
+        self,
+        context: BrowserContext,
+        max_pages: int = 8,
+        reuse_pages: bool = True,
+        reset_between_uses: bool = False,
+    ) -> None:
+        if max_pages < 1:
+            raise ValueError(f"'max_pages' must be at least 1, got {max_pages}")
+        self.context = context
+        self.max_pages = max_pages
+        self.reuse_pages = reuse_pages
+        self.reset_between_uses = reset_between_uses
+        self._semaphore = asyncio.Semaphore(max_pages)
+        self._idle: deque[Page] = deque()
+
+    async def _get_page(self) -> Page:
+        while self._idle:
+            page = self._idle.popleft()
+            if not page.is_closed():
+                return page
+        return await self.context.new_page()
+
+    async def _release(self, page: Page) -> None:
+        if page.is_closed():
+            return
+        if not self.reuse_pages:
+            await page.close()
+            return
+        if self.reset_between_uses:
+            try:
+                await page.goto("about:blank")
+            except Exception:
+                await page.close()
+                return
+        self._idle.append(page)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[Page]:
+        """
+        Example:
+        --------
+        >>> async with pool.acquire() as page:
+        >>>     await page.goto("https://example.com")
+        """
+        async with self._semaphore:
+            page = await self._get_page()
+            try:
+                yield page
+            finally:
+                await self._release(page)
+
+    async def close(self) -> None:
+        """Closes all idle pages."""
+        while self._idle:
+            page = self._idle.popleft()
+            if not page.is_closed():
+                await page.close()
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+
+__all__ = ["PagePool"]
@@ -1,14 +1,15 @@
 from dataclasses import dataclass
 from typing import Callable, Literal
 
+from loguru import logger
 from playwright.sync_api import BrowserContext, Page, Request, Response  # noqa
 
-from wrighter.core import logger
-
 EVENT_DUNDER_NAME = "__event__"
 
+EventNames = tuple[tuple[str, str], ...]
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Event:
     name: str
     event_type: Literal["page", "context"]
@@ -53,11 +54,69 @@ def context(when: str, event: str):
 class Plugin:
     """Base class for Wrighter Plugins"""
 
+    __slots__ = (
+        "_description",
+        "logger",
+        "_events",
+        "_page_on",
+        "_page_once",
+        "_context_on",
+        "_context_once",
+    )
+
+    init_script: str | None = None
+    """JavaScript evaluated in every page of contexts created after the plugin was added."""
+
+    __plugin_events__: tuple[tuple[Event, str], ...] = ()
+    """The events of the class and the names of their handlers. Collected when the class is defined."""
+    __page_events__: tuple[EventNames, EventNames] = ((), ())
+    """(event name, handler name) pairs of the page events, split into 'on' and 'once' events."""
+    __context_events__: tuple[EventNames, EventNames] = ((), ())
+    """(event name, handler name) pairs of the context events, split into 'on' and 'once' events."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Names are collected from the whole MRO (including mixins), but resolved on the class,
+        # so an override without a decorator is not a handler
+        events: dict[str, Event] = {}
+        for method_name in dict.fromkeys(i for klass in reversed(cls.__mro__) for i in vars(klass)):
+            event = getattr(getattr(cls, method_name, None), EVENT_DUNDER_NAME, None)
+            if event is not None:
+                events[method_name] = event
+        cls.__plugin_events__ = tuple((event, name) for name, event in events.items())
+        buckets: dict[tuple[str, str], list[tuple[str, str]]] = {
+            (event_type, when): [] for event_type in ("page", "context") for when in ("on", "once")
+        }
+        for method_name, event in events.items():
+            if (event.event_type, event.when) not in buckets:
+                raise ValueError(event.when)
+            buckets[event.event_type, event.when].append((event.name, method_name))
+        cls.__page_events__ = (tuple(buckets["page", "on"]), tuple(buckets["page", "once"]))
+        cls.__context_events__ = (
+            tuple(buckets["context", "on"]),
+            tuple(buckets["context", "once"]),
+        )
+
     def __init__(self) -> None:
         self._description = self.__class__.__doc__
         self.logger = logger.bind(title=self.__class__.__name__)
         if not self._description:
             self._description = "No description"
+        self._bind_handlers()
+
+    @property
+    def _handlers_bound(self) -> bool:
+        return hasattr(self, "_context_once")
+
+    def _bind_handlers(self) -> None:
+        self._events = [(event, getattr(self, name)) for event, name in self.__plugin_events__]
+        self._page_on = self._bind(self.__page_events__[0])
+        self._page_once = self._bind(self.__page_events__[1])
+        self._context_on = self._bind(self.__context_events__[0])
+        self._context_once = self._bind(self.__context_events__[1])
+
+    def _bind(self, events: EventNames) -> list[tuple[str, Callable]]:
+        return [(event_name, getattr(self, method_name)) for event_name, method_name in events]
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}()"
@@ -66,34 +125,39 @@ class Plugin:
     def description(self):
         return f"{self.__class__.__name__} - {self._description} "
 
-    def _add(self, obj: Page | BrowserContext, event_type: Literal["page", "context"]) -> None:
-        for event, handler in self.events:
-            if event.event_type != event_type:
-                continue
-            if event.when == "on":
-                obj.on(event.name, handler)  # type:ignore
-            elif event.when == "once":
-                obj.once(event.name, handler)  # type:ignore
-            else:
-                raise ValueError(event.when)
-
-    def _remove(self, obj: Page | BrowserContext, obj_type: Literal["page", "context"]) -> None:
-        for event, handler in self.events:
-            if event.event_type != obj_type:
-                continue
-            obj.remove_listener(event.name, handler)
+    def _add(
+        self,
+        obj: Page | BrowserContext,
+        on: list[tuple[str, Callable]],
+        once: list[tuple[str, Callable]],
+    ) -> None:
+        for name, handler in on:
+            obj.on(name, handler)  # type:ignore
+        for name, handler in once:
+            obj.once(name, handler)  # type:ignore
+
+    def _remove(
+        self,
+        obj: Page | BrowserContext,
+        on: list[tuple[str, Callable]],
+        once: list[tuple[str, Callable]],
+    ) -> None:
+        for name, handler in on:
+            obj.remove_listener(name, handler)
+        for name, handler in once:
+            obj.remove_listener(name, handler)
 
     @property
     def events(self) -> list[(tuple[Event, Callable])]:
-        events = []
-        for method_name in dir(self):
-            if method_name == "events":
-                continue
-            method = getattr(self, method_name)
-            if not hasattr(method, EVENT_DUNDER_NAME):
-                continue
-            events.append((getattr(method, EVENT_DUNDER_NAME), method))
-        return events
+        return self._events
+
+    @property
+    def has_page_events(self) -> bool:
+        return bool(self._page_on or self._page_once)
+
+    @property
+    def has_context_events(self) -> bool:
+        return bool(self._context_on or self._context_once)
 
     """
     @property
@@ -106,16 +170,16 @@ class Plugin:
     """
 
     def add_to_page(self, page: Page) -> None:
-        self._add(page, "page")
+        self._add(page, self._page_on, self._page_once)
 
     def add_to_context(self, ctx: BrowserContext) -> None:
-        self._add(ctx, "context")
+        self._add(ctx, self._context_on, self._context_once)
 
     def remove_from_page(self, page: Page) -> None:
-        self._remove(page, "page")
+        self._remove(page, self._page_on, self._page_once)
 
     def remove_from_context(self, ctx: BrowserContext) -> None:
-        self._remove(ctx, "context")
+        self._remove(ctx, self._context_on, self._context_once)
 
 
 __all__ = ["Plugin", "page", "context"]
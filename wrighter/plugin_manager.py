@@ -1,13 +1,80 @@
+import asyncio
+import inspect
+from typing import Any, Callable
+
 from playwright.sync_api import BrowserContext, Page
 from stdl.st import FG, colored
 
 from wrighter.plugin import Plugin
 
 
+def _wrap_init_script(script: str) -> str:
+    """Wraps an init script in an IIFE so its declarations do not leak into other scripts."""
+    return f"(() => {{\n{script}\n}})();"
+
+
+_background_tasks: set[asyncio.Future] = set()
+
+
+def _run_or_schedule(result: Any) -> None:
+    """Schedules `result` on the running event loop if it is awaitable (async API calls)."""
+    if inspect.isawaitable(result):
+        task = asyncio.ensure_future(result)
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
 class PluginManager:
-    def __init__(self, wrighter) -> None:
+    __slots__ = (
+        "wrighter",
+        "_plugins",
+        "init_script",
+        "has_plugins",
+        "_page_callbacks",
+        "_context_callbacks",
+        "_by_class",
+    )
+
+    def __init__(self, wrighter, plugins: list[Plugin] | None = None) -> None:
         self.wrighter = wrighter
-        self.plugins: list[Plugin] = []
+        self._plugins: list[Plugin] = list(plugins) if plugins else []
+        for plugin in self._plugins:
+            self._ensure_bound(plugin)
+        self.init_script = ""
+        self.has_plugins = False
+        self._page_callbacks: tuple[Callable[[Page], None], ...] = ()
+        self._context_callbacks: tuple[Callable[[BrowserContext], None], ...] = ()
+        self._by_class: dict[type, list[Plugin]] = {}
+        self._compile()
+
+    @staticmethod
+    def _ensure_bound(plugin: Plugin) -> None:
+        """Binds the handlers of plugins whose __init__ does not call Plugin.__init__."""
+        if not plugin._handlers_bound:
+            plugin._bind_handlers()
+
+    def _compile(self) -> None:
+        """Rebuilds the state derived from the plugin list. Must be called after every change to it."""
+        self.has_plugins = bool(self._plugins)
+        self._page_callbacks = tuple(i.add_to_page for i in self._plugins if i.has_page_events)
+        self._context_callbacks = tuple(
+            i.add_to_context for i in self._plugins if i.has_context_events
+        )
+        self._by_class = {}
+        for plugin in self._plugins:
+            for cls in type(plugin).__mro__:
+                self._by_class.setdefault(cls, []).append(plugin)
+        self.init_script = "\n".join(
+            _wrap_init_script(i.init_script) for i in self._plugins if i.init_script
+        )
+
+    @property
+    def plugins(self) -> tuple[Plugin, ...]:
+        """
+        The added plugins, as a read-only tuple.
+        Use `add_plugin`, `remove_plugin` and `remove_all` to change them.
+        """
+        return tuple(self._plugins)
 
     def add_plugin(self, plugin: Plugin, *, existing=True):
         """
@@ -21,12 +88,16 @@ class PluginManager:
         Returns:
             None
         """
-        self.plugins.append(plugin)
+        self._ensure_bound(plugin)
+        self._plugins.append(plugin)
+        self._compile()
         if existing:
             for page in self.wrighter.pages:
                 plugin.add_to_page(page)
             for ctx in self.wrighter.contexts:
                 plugin.add_to_context(ctx)
+                if plugin.init_script:
+                    _run_or_schedule(ctx.add_init_script(_wrap_init_script(plugin.init_script)))
 
     def remove_plugin(self, plugin: Plugin, *, existing=True) -> None:
         """
@@ -35,12 +106,14 @@ class PluginManager:
         Args:
             plugin (Plugin): The plugin to remove.
             existing (bool, optional): If `True`, remove the plugin from all existing pages and contexts.
-                Defaults to `True`.
+                Defaults to `True`. The init script of the plugin cannot be removed from a context
+                once it was added, so it keeps running in new pages of existing contexts.
 
         Returns:
             None
         """
-        self.plugins.remove(plugin)
+        self._plugins.remove(plugin)
+        self._compile()
         if existing:
             for page in self.wrighter.pages:
                 plugin.remove_from_page(page)
@@ -58,28 +131,40 @@ class PluginManager:
         Returns:
             None
         """
-        for plugin in self.plugins:
-            self.remove_plugin(plugin, existing=existing)
-        self.plugins.clear()
+        plugins = self._plugins[:]
+        self._plugins.clear()
+        self._compile()
+        if existing:
+            for page in self.wrighter.pages:
+                for plugin in plugins:
+                    plugin.remove_from_page(page)
+            for ctx in self.wrighter.contexts:
+                for plugin in plugins:
+                    plugin.remove_from_context(ctx)
 
     def page_apply_plugins(self, page: Page):
         """Add all plugins to a page"""
-        for plugin in self.plugins:
-            plugin.add_to_page(page)
+        for callback in self._page_callbacks:
+            callback(page)
 
     def context_apply_plugins(self, ctx: BrowserContext):
         """Add all plugins to a context"""
-        for plugin in self.plugins:
-            plugin.add_to_context(ctx)
+        for callback in self._context_callbacks:
+            callback(ctx)
 
-    def get_plugins_by_class(self, cls: Plugin) -> list[Plugin]:
-        return [i for i in self.plugins if isinstance(i, cls)]  # type:ignore
+    def get_plugins_by_class(self, cls: type[Plugin]) -> list[Plugin]:
+        """Returns the plugins that are instances of `cls`."""
+        plugins = self._by_class.get(cls) if isinstance(cls, type) else None
+        if plugins is not None:
+            return list(plugins)
+        # Tuples of classes and virtual subclasses (ABC.register) are not in the MRO index
+        return [i for i in self._plugins if isinstance(i, cls)]
 
     def print_plugins(self):
         print(colored("Plugins", FG.LIGHT_BLUE) + ":")
-        for plugin in self.plugins:
+        for plugin in self._plugins:
             print(f"\t{plugin.description}")
-        if not self.plugins:
+        if not self._plugins:
             print("No plugins added.")
 
 
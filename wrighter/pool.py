@@ -0,0 +1,119 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Awaitable, Callable
+
+from playwright.async_api import BrowserContext
+
+
+@dataclass
+class PooledContext:
+    context: BrowserContext
+    created_at: float = field(default_factory=time.monotonic)
+    usage_count: int = 0
+
+    def is_expired(self, max_uses: int | None, max_age: float | None) -> bool:
+        if max_uses is not None and self.usage_count >= max_uses:
+            return True
+        if max_age is not None and time.monotonic() - self.created_at >= max_age:
+            return True
+        return False
+
+
+class ContextPool:
+    """
+    Keeps warm browser contexts around so they can be reused instead of being created for every task.
+
+    Args:
+        factory (Callable): Coroutine function that creates a new browser context.
+        max_size (int): The maximum number of contexts that can be in use at the same time.
+        min_size (int): The number of contexts created in advance by `fill`. Defaults to 0.
+        max_uses (int, optional): Recycle a context after it was acquired this many times.
+        max_age (float, optional): Recycle a context after it has been alive for this many seconds.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Awaitable[BrowserContext]],
+        max_size: int = 4,
+        max_uses: int | None = None,
+        max_age: float | None = None,
+        min_size: int = 0,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError(f"'max_size' must be at least 1, got {max_size}")
+        if not 0 <= min_size <= max_size:
+            raise ValueError(f"'min_size' must be between 0 and {max_size}, got {min_size}")
+        self.factory = factory
+        self.max_size = max_size
+        self.min_size = min_size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self._idle: asyncio.Queue[PooledContext] = asyncio.Queue()
+        self._semaphore = asyncio.Semaphore(max_size)
+
+    async def _create_one(self) -> PooledContext:
+        return PooledContext(await self.factory())
+
+    async def fill(self) -> None:
+        """Creates idle contexts until there are at least `min_size` of them."""
+        missing = self.min_size - self._idle.qsize()
+        if missing <= 0:
+            return
+        for item in await asyncio.gather(*[self._create_one() for _ in range(missing)]):
+            self._idle.put_nowait(item)
+
+    async def acquire(self) -> PooledContext:
+        """
+        Waits for a free slot and returns an idle context, creating a new one if none is available.
+        Contexts that exceeded `max_uses` or `max_age` are closed and replaced.
+        """
+        await self._semaphore.acquire()
+        try:
+            while not self._idle.empty():
+                item = self._idle.get_nowait()
+                if not item.is_expired(self.max_uses, self.max_age):
+                    return item
+                await item.context.close()
+            return await self._create_one()
+        except BaseException:
+            self._semaphore.release()
+            raise
+
+    async def release(self, item: PooledContext) -> None:
+        """Returns a context to the pool or closes it if it should be recycled."""
+        item.usage_count += 1
+        try:
+            if item.is_expired(self.max_uses, self.max_age):
+                await item.context.close()
+            else:
+                self._idle.put_nowait(item)
+        finally:
+            self._semaphore.release()
+
+    @asynccontextmanager
+    async def context(self) -> AsyncIterator[BrowserContext]:
+        """
+        Example:
+        --------
+        >>> async with pool.context() as ctx:
+        >>>     page = await ctx.new_page()
+        """
+        item = await self.acquire()
+        try:
+            yield item.context
+        finally:
+            await self.release(item)
+
+    async def close(self) -> None:
+        """Closes all idle contexts."""
+        while not self._idle.empty():
+            await self._idle.get_nowait().context.close()
+
+    @property
+    def idle(self) -> int:
+        return self._idle.qsize()
+
+
+__all__ = ["ContextPool", "PooledContext"]
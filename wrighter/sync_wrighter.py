@@ -1,5 +1,4 @@
 # noqa: F401
-import random
 import time
 from pathlib import Path
 from typing import Any, Mapping
@@ -26,10 +25,57 @@ class SyncWrighter(WrighterCore):
         plugins: list[Plugin] | None = None,
     ) -> None:
         super().__init__(options, plugins)
-        self.playwright = self.__start_playwright()
-        self._resolve_options()
-        self.browser = self._launch_browser()
-        self.context = self.__launch_context()
+
+    def start(self) -> None:
+        """
+        Starts the Playwright instance, launches a browser, and creates a browser context.
+        Called automatically the first time `playwright`, `browser` or `context` is accessed.
+        """
+        if self._playwright is not ...:
+            return
+        self._playwright = self.__start_playwright()
+        try:
+            self._init_drivers()
+            self._resolve_options()
+            self.browser = self._launch_browser()
+            self._context = self.__launch_context()
+        except BaseException:
+            # Stop Playwright so that the next access retries instead of returning placeholders
+            try:
+                self.stop()
+            except Exception:
+                pass
+            raise
+
+    @property
+    def playwright(self) -> Playwright:
+        if self._playwright is ...:
+            self.start()
+        return self._playwright
+
+    @playwright.setter
+    def playwright(self, value: Playwright) -> None:
+        self._playwright = value
+
+    @property
+    def browser(self) -> Browser | BrowserContext:
+        if self._browser is ...:
+            self.start()
+        return self._browser
+
+    @browser.setter
+    def browser(self, value: Browser | BrowserContext) -> None:
+        WrighterCore.browser.fset(self, value)  # type:ignore
+
+    @property
+    def context(self) -> BrowserContext:
+        if self._context is ...:
+            self.start()
+        return self._context
+
+    @context.setter
+    def context(self, value: BrowserContext) -> None:
+        self._context = value
 
     def __enter__(self):
         return self
@@ -58,8 +104,7 @@ class SyncWrighter(WrighterCore):
         if self.is_persistent:
             opts = self.options.persistent_context_options
             browser_context = driver.launch_persistent_context(**opts)
-            browser_context.on("page", lambda page: self.plugin_manager.page_apply_plugins(page))
-            self.plugin_manager.context_apply_plugins(browser_context)
+            self._setup_context(browser_context)
             return browser_context
         return driver.launch(**self.options.browser_launch_options)
 
@@ -69,10 +114,21 @@ class SyncWrighter(WrighterCore):
         return self.new_context()
 
     def stop(self) -> None:
+        """Closes the context and browser that were created and stops Playwright."""
+        if self._playwright is ...:
+            return
         self.logger.debug("Stopping Playwright")
-        self.context.close()
-        self.browser.close()
-        self.playwright.stop()
+        try:
+            if self._context is not ...:
+                self._context.close()
+            if self._browser is not ...:
+                self._browser.close()
+        finally:
+            playwright = self._playwright
+            self._context = ...  # type:ignore
+            self.browser = ...  # type:ignore
+            self._playwright = ...  # type:ignore
+            playwright.stop()
 
     def new_context(self) -> BrowserContext:
         """
@@ -86,10 +142,32 @@ class SyncWrighter(WrighterCore):
         if self.is_persistent:
             raise RuntimeError("Cannot create contexts in persistent mode.")
         context = self.browser.new_context(**self.options.context_options)  # type:ignore
-        context.on("page", lambda page: self.plugin_manager.page_apply_plugins(page))
-        self.plugin_manager.context_apply_plugins(context)
+        self._setup_context(context)
         return context
 
+    def _setup_context(self, context: BrowserContext) -> None:
+        """Applies request interception and plugins to a newly launched context."""
+        blocked = self.blocked_resources
+        if blocked:
+            context.route("**/*", self._resource_blocker(blocked))
+        init_script = self.plugin_manager.init_script
+        if init_script:
+            context.add_init_script(init_script)
+        for page in context.pages:
+            self._track_page(page)
+        context.on("page", self._on_page)
+        if self.plugin_manager.has_plugins:
+            self.plugin_manager.context_apply_plugins(context)
+
+    def _resource_blocker(self, blocked: frozenset[str]):
+        def handler(route: Route) -> None:
+            if route.request.resource_type in blocked:
+                route.abort()
+            else:
+                route.continue_()
+
+        return handler
+
     def sleep(self, lo: float, hi: float | None = None) -> float:
         """
         Sleeps for a random duration within a specified range.
@@ -105,14 +183,8 @@ class SyncWrighter(WrighterCore):
             ValueError: If `hi` is provided and `lo` is greater than `hi`.
         """
 
-        if hi is None:
-            time.sleep(lo)
-            self.logger.info(f"Sleeping for {round(lo,2)}s")
-            return lo
-        if lo > hi:
-            raise ValueError(f"Minimum sleep time is higher that maximum. {(lo,hi)}")
-        t = random.uniform(lo, hi)
-        self.logger.info(f"Sleeping for {round(t,2)}s")
+        t = self._sleep_duration(lo, hi)
+        self.logger.opt(lazy=True).info("Sleeping for {}s", lambda: round(t, 2))
         time.sleep(t)
         return t
 